@@ -3,14 +3,44 @@
 This script processes a CSV file to detect and redact Personally Identifiable Information (PII)
 based on specific rules for standalone and combinatorial PII.
 
-Usage: python3 detector_full_candidate_name.py iscp_pii_dataset.csv
+Usage: python3 detector_full_candidate_name.py iscp_pii_dataset.csv [--jobs N]
 """
 
 import pandas as pd
+import argparse
 import json
+import multiprocessing as mp
+import os
 import re
 import sys
-from typing import Dict, List, Tuple, Any
+import tempfile
+from contextlib import nullcontext
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Redacted output file and its columns
+OUTPUT_FILENAME = 'redacted_output_candidate_full_name.csv'
+OUTPUT_COLUMNS = ['record_id', 'redacted_data_json', 'is_pii']
+
+# Rows read from the input CSV at a time
+READ_CHUNK_SIZE = 10_000
+
+# Accepted spellings of the JSON payload column
+JSON_COLUMNS = ['data_json', 'Data_json', 'Data_JSON', 'data_JSON']
+
+# Recognised UPI handle suffixes (the part after '@')
+UPI_PROVIDERS = frozenset({
+    'paytm', 'ybl', 'okaxis', 'axisbank', 'hdfcbank', 'icici', 'sbi', 'kotak', 'phonepe', 'ibl', 'unionbank',
+    'canara', 'pnb', 'andhra', 'federal', 'karnataka', 'punjab', 'maharashtra', 'axis', 'indianbank', 'yesbank',
+})
+
+# Keys that are standalone PII by name, whatever their value looks like
+STANDALONE_KEYS = frozenset({'phone', 'aadhar', 'passport', 'upi_id'})
+
+# Standalone keys whose values may arrive as JSON numbers
+NUMERIC_ID_KEYS = frozenset({'phone', 'aadhar'})
+
+# Keys that count as the device/network element of combinatorial PII
+DEVICE_KEYS = ('device_id', 'ip_address')
 
 
 class PIIDetector:
@@ -21,45 +51,68 @@ class PIIDetector:
     Combinatorial PII (need ≥2 together): name/full-name, email, address, device_id/ip_address
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         # Standalone PII
-        self.phone_pattern = re.compile(r'\b[6-9]\d{9}\b')          # Indian mobile numbers
-        self.aadhar_pattern = re.compile(r'\b\d{12}\b')             # 12-digit number
-        self.passport_pattern = re.compile(r'\b[A-Z]\d{7}\b')       # e.g., P1234567
-        self.upi_pattern = re.compile(
-            r'\b[\w\d]+@(paytm|ybl|okaxis|axisbank|hdfcbank|icici|sbi|kotak|phonepe|ibl|unionbank|canara|pnb|andhra|federal|karnataka|punjab|maharashtra|axis|indianbank|yesbank)\b'
+        self.phone_pattern = re.compile(r'[6-9]\d{9}')                # Indian mobile numbers
+        self.aadhar_pattern = re.compile(r'\d{12}')                   # 12-digit number
+        self.passport_pattern = re.compile(r'[A-Z]\d{7}')             # e.g., P1234567
+        providers = '|'.join(sorted(UPI_PROVIDERS))
+        # All standalone types fused into one alternation; lastgroup names the match
+        self.standalone_re = re.compile(
+            r'(?P<phone>[6-9]\d{9})|(?P<aadhar>\d{12})|(?P<passport>[A-Z]\d{7})'
+            rf'|(?P<upi>[\w\d]+@(?:{providers}))'
         )
         # Other types used in combinatorial PII
         self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
         self.name_pattern = re.compile(r'^[A-Z][a-z]+ [A-Z][a-z]+$')  # Simple First Last
         self.ip_pattern = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b')
+        self.pin_pattern = re.compile(r'\b\d{6}\b')                # Indian PIN code in addresses
+
+        # Masking handlers keyed on field name
+        self._mask_handlers = self._build_mask_handlers()
 
     def is_phone_number(self, v: str) -> bool:
         if isinstance(v, (int, float)): v = str(int(v))
-        return bool(self.phone_pattern.match(str(v)))
+        return bool(self.phone_pattern.fullmatch(v))
 
     def is_aadhar(self, v: str) -> bool:
         if isinstance(v, (int, float)): v = str(int(v))
-        return bool(self.aadhar_pattern.match(str(v)))
+        return bool(self.aadhar_pattern.fullmatch(v))
 
     def is_passport(self, v: str) -> bool:
-        return bool(self.passport_pattern.match(str(v)))
+        return bool(self.passport_pattern.fullmatch(v))
 
     def is_upi_id(self, v: str) -> bool:
-        return bool(self.upi_pattern.match(str(v)))
+        # Providers are literals, so split on '@' and do a set lookup instead of
+        # running the alternation; '_' counts as a word char like \w in the pattern.
+        at = v.rfind('@')
+        return at > 0 and v[at + 1:] in UPI_PROVIDERS and v[:at].replace('_', '0').isalnum()
+
+    def classify_standalone(self, s: str) -> Optional[str]:
+        """Return 'phone', 'aadhar', 'passport' or 'upi' for a standalone PII value, else None."""
+        # Length / first-char dispatch settles the fixed-shape types without the regex.
+        # isdecimal() is used rather than isdigit() to stay equivalent to \d.
+        n = len(s)
+        if n == 10 and s[0] in '6789' and s.isdecimal():
+            return 'phone'
+        if n == 12 and s.isdecimal():
+            return 'aadhar'
+        if n == 8 and 'A' <= s[0] <= 'Z' and s[1:].isdecimal():
+            return 'passport'
+        if self.is_upi_id(s):
+            return 'upi'
+        return None
 
     def is_email(self, v: str) -> bool:
-        return bool(self.email_pattern.match(str(v)))
+        return bool(self.email_pattern.match(v))
 
     def is_full_name(self, v: str) -> bool:
-        return bool(self.name_pattern.match(str(v)))
+        return bool(self.name_pattern.match(v))
 
     def has_address_components(self, v: str) -> bool:
-        s = str(v).lower()
-        has_numbers = bool(re.search(r'\d+', s))        # street/house no.
-        has_comma = ',' in s                            # separator
-        has_pin = bool(re.search(r'\b\d{6}\b', s))      # Indian PIN
-        return has_numbers and has_comma and has_pin
+        # Needs a separator and an Indian PIN; the PIN also covers the street/house
+        # number check. Cheapest test first, and no lower() since case is irrelevant.
+        return ',' in v and self.pin_pattern.search(v) is not None
 
     # ---------- Detection ----------
     def detect_standalone_pii(self, data: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -67,32 +120,24 @@ class PIIDetector:
         for k, val in data.items():
             if val is None: 
                 continue
-            s = str(val)
-            if k == 'phone' or self.is_phone_number(s):
-                pii_found, fields = True, fields + [k]
-            elif k == 'aadhar' or self.is_aadhar(s):
-                pii_found, fields = True, fields + [k]
-            elif k == 'passport' or self.is_passport(s):
-                pii_found, fields = True, fields + [k]
-            elif k == 'upi_id' or self.is_upi_id(s):
-                pii_found, fields = True, fields + [k]
+            s = val if isinstance(val, str) else str(val)
+            if k in STANDALONE_KEYS or self.classify_standalone(s) is not None:
+                pii_found = True; fields.append(k)
         return pii_found, fields
 
     def detect_combinatorial_pii(self, data: Dict[str, Any]) -> Tuple[bool, List[str], int]:
-        found, fields = [], []
+        fields: List[str] = []
         has_full_name = has_email = has_address = has_device = has_name_parts = False
 
-        for k, val in data.items():
-            if val is None:
-                continue
-            s = str(val)
-            if k == 'name' and self.is_full_name(s):
-                has_full_name = True; fields.append(k)
-            elif k == 'email' and self.is_email(s):
-                has_email = True; fields.append(k)
-            elif k == 'address' and self.has_address_components(s):
-                has_address = True; fields.append(k)
-            elif k in ['device_id', 'ip_address']:
+        # Direct lookups of the few relevant keys instead of scanning every field
+        if (v := data.get('name')) is not None and self.is_full_name(v if isinstance(v, str) else str(v)):
+            has_full_name = True; fields.append('name')
+        if (v := data.get('email')) is not None and self.is_email(v if isinstance(v, str) else str(v)):
+            has_email = True; fields.append('email')
+        if (v := data.get('address')) is not None and self.has_address_components(v if isinstance(v, str) else str(v)):
+            has_address = True; fields.append('address')
+        for k in DEVICE_KEYS:
+            if data.get(k) is not None:
                 has_device = True; fields.append(k)
 
         if data.get('first_name') and data.get('last_name'):
@@ -103,110 +148,286 @@ class PIIDetector:
         return count >= 2, fields, count
 
     # ---------- Masking ----------
-    def mask_value(self, key: str, value: Any) -> str:
+    def _mask_phone(self, s: str) -> str:
+        return f"{s[:2]}{'X' * (len(s) - 4)}{s[-2:]}" if len(s) >= 10 else 'X' * len(s)
+
+    def _mask_aadhar(self, s: str) -> str:
+        return f"{s[:3]}XXXXXX{s[-3:]}" if len(s) >= 12 else 'X' * len(s)
+
+    def _mask_passport(self, s: str) -> str:
+        return f"{s[0]}{'X' * (len(s) - 2)}{s[-1]}" if len(s) >= 3 else 'X' * len(s)
+
+    def _mask_handle(self, s: str) -> str:
+        # user@domain (UPI IDs and emails): keep the domain, mask the user part
+        parts = s.split('@')
+        if len(parts) == 2:
+            u, d = parts
+            if len(u) > 2:
+                return f"{u[0]}{'X' * (len(u) - 2)}{u[-1]}@{d}"
+            return f"{'X' * len(u)}@{d}"
+        return 'X' * len(s)
+
+    def _mask_name(self, s: str) -> str:
+        if not self.is_full_name(s):
+            return '[REDACTED_PII]'
+        return ' '.join(f"{p[0]}{'X' * (len(p) - 1)}" if len(p) > 1 else 'X' for p in s.split())
+
+    def _mask_name_part(self, s: str) -> str:
+        return f"{s[0]}{'X' * (len(s) - 1)}" if len(s) > 1 else 'X'
+
+    def _build_mask_handlers(self) -> Dict[str, Callable[[str], str]]:
+        return {
+            'phone': self._mask_phone,
+            'aadhar': self._mask_aadhar,
+            'passport': self._mask_passport,
+            'upi_id': self._mask_handle,
+            'email': self._mask_handle,
+            'name': self._mask_name,
+            'first_name': self._mask_name_part,
+            'last_name': self._mask_name_part,
+            'address': lambda s: '[REDACTED_ADDRESS]',
+            'device_id': lambda s: '[REDACTED_DEVICE_ID]',
+            'ip_address': lambda s: '[REDACTED_IP_ADDRESS]',
+        }
+
+    def mask_value(self, key: str, value: Any) -> Optional[str]:
         if value is None:
             return None
-        s = str(value)
-        if isinstance(value, (int, float)) and key in ['phone', 'aadhar']:
+        s = value if isinstance(value, str) else str(value)
+        if isinstance(value, (int, float)) and key in NUMERIC_ID_KEYS:
             s = str(int(value))
 
-        if key == 'phone' or self.is_phone_number(s):
-            return s[:2] + 'X' * (len(s) - 4) + s[-2:] if len(s) >= 10 else 'X' * len(s)
-        elif key == 'aadhar' or self.is_aadhar(s):
-            return s[:3] + 'X' * 6 + s[-3:] if len(s) >= 12 else 'X' * len(s)
-        elif key == 'passport' or self.is_passport(s):
-            return s[0] + 'X' * (len(s) - 2) + s[-1] if len(s) >= 3 else 'X' * len(s)
-        elif key == 'upi_id' or self.is_upi_id(s):
-            parts = s.split('@')
-            if len(parts) == 2:
-                u, d = parts
-                mu = (u[:1] + 'X' * (len(u) - 2) + u[-1:]) if len(u) > 2 else 'X' * len(u)
-                return f"{mu}@{d}"
-            return 'X' * len(s)
-        elif key == 'email' or self.is_email(s):
-            parts = s.split('@')
-            if len(parts) == 2:
-                u, d = parts
-                mu = (u[:1] + 'X' * (len(u) - 2) + u[-1:]) if len(u) > 2 else 'X' * len(u)
-                return f"{mu}@{d}"
-            return 'X' * len(s)
-        elif key == 'name' and self.is_full_name(s):
-            return ' '.join((p[0] + 'X' * (len(p) - 1)) if len(p) > 1 else 'X' for p in s.split())
-        elif key in ['first_name', 'last_name']:
-            return s[0] + 'X' * (len(s) - 1) if len(s) > 1 else 'X'
-        elif key == 'address':
-            return '[REDACTED_ADDRESS]'
-        elif key in ['device_id', 'ip_address']:
-            return f"[REDACTED_{key.upper()}]"
+        # Known keys go straight to their handler; the value was already validated during detection
+        handler = self._mask_handlers.get(key)
+        if handler is not None:
+            return handler(s)
+
+        # Unknown key (flagged by value shape): reuse the cheap standalone classifier
+        kind = self.classify_standalone(s)
+        if kind == 'phone':
+            return self._mask_phone(s)
+        elif kind == 'aadhar':
+            return self._mask_aadhar(s)
+        elif kind == 'passport':
+            return self._mask_passport(s)
+        elif kind == 'upi' or self.is_email(s):
+            return self._mask_handle(s)
         else:
             return '[REDACTED_PII]'
 
     # ---------- Per-record processing ----------
     def process_record(self, record: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
-        red = record.copy()
         has_standalone, stand_fields = self.detect_standalone_pii(record)
         has_combo, combo_fields, _ = self.detect_combinatorial_pii(record)
-        is_pii = has_standalone or has_combo
-
-        if is_pii:
-            for f in stand_fields:
-                if f in red: red[f] = self.mask_value(f, red[f])
-            if has_combo:
-                for f in combo_fields:
-                    if f in red: red[f] = self.mask_value(f, red[f])
+        if not (has_standalone or has_combo):
+            # Nothing to mask: hand the record back as-is instead of copying it
+            return False, record
+
+        red = dict(record)
+        for f in stand_fields:
+            red[f] = self.mask_value(f, red[f])
+        if has_combo:
+            for f in combo_fields:
+                red[f] = self.mask_value(f, red[f])
+        return True, red
+
+    # ---------- Column-oriented processing ----------
+    def process_frame(self, records: pd.DataFrame) -> Tuple[pd.Series, pd.DataFrame]:
+        """
+        Vectorized equivalent of process_record for column-oriented input:
+        one row per record, one column per field, missing fields as NaN/None.
+
+        Detection runs as pandas string ops over whole columns; only the cells
+        that need masking go through mask_value. Returns (is_pii, redacted).
+        """
+        present = records.notna()
+        none = pd.Series(False, index=records.index)
+
+        def cell_values(col: pd.Series) -> pd.Series:
+            # Integer fields with gaps come back as float; restore the ints so shape
+            # checks and masking see '9876543210' as process_record would, not '9876543210.0'
+            if col.dtype.kind != 'f':
+                return col
+            whole = col.notna() & (col % 1 == 0) & (col.abs() < 2 ** 63)
+            return col.astype(object).where(~whole, col[whole].astype('int64').astype(object))
+
+        cells = {k: cell_values(records[k]) for k in records.columns}
+
+        def text(k: str) -> pd.Series:
+            return cells[k].astype(str)
+
+        def matches(k: str, pattern: str) -> pd.Series:
+            return present[k] & text(k).str.match(pattern) if k in records else none
+
+        def truthy(k: str) -> pd.Series:
+            return present[k] & records[k].astype(bool) if k in records else none
+
+        # Standalone: the key names the type, or the value has a standalone shape
+        stand_hits = {
+            k: present[k] if k in STANDALONE_KEYS
+            else present[k] & text(k).str.fullmatch(self.standalone_re.pattern)
+            for k in records.columns
+        }
+
+        # Combinatorial: same elements as detect_combinatorial_pii, one boolean column each
+        has_full_name = matches('name', self.name_pattern.pattern)
+        has_email = matches('email', self.email_pattern.pattern)
+        if 'address' in records:
+            addr = text('address')
+            has_address = (present['address'] & addr.str.contains(',', regex=False)
+                           & addr.str.contains(self.pin_pattern.pattern))
+        else:
+            has_address = none
+        has_device_id = present['device_id'] if 'device_id' in records else none
+        has_ip = present['ip_address'] if 'ip_address' in records else none
+        has_name_parts = truthy('first_name') & truthy('last_name')
+
+        count = (has_full_name.astype(int) + has_email.astype(int) + has_address.astype(int)
+                 + (has_device_id | has_ip).astype(int) + has_name_parts.astype(int))
+        has_combo = count >= 2
+        combo_hits = {
+            'name': has_full_name, 'email': has_email, 'address': has_address,
+            'device_id': has_device_id, 'ip_address': has_ip,
+            'first_name': has_name_parts, 'last_name': has_name_parts,
+        }
+
+        is_pii = has_combo.copy()
+        for hit in stand_hits.values():
+            is_pii |= hit
+
+        red = records.copy()
+        for k in records.columns:
+            hit = stand_hits[k] | (has_combo & combo_hits.get(k, none))
+            if hit.any():
+                masked = cells[k].loc[hit].map(lambda v, k=k: self.mask_value(k, v))
+                red[k] = records[k].where(~hit, masked)
         return is_pii, red
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 detector_full_candidate_name.py <input_csv_file>")
-        sys.exit(1)
+def write_output(out_f: BinaryIO, ids: Any, out_json: List[Optional[str]], out_pii: List[bool]) -> None:
+    """Append rows (no header) to the redacted CSV."""
+    pd.DataFrame({
+        'record_id': ids,
+        'redacted_data_json': out_json,
+        'is_pii': out_pii,
+    }).to_csv(out_f, header=False, index=False, mode='wb', lineterminator='\n')
 
-    input_filename = sys.argv[1]
 
-    try:
-        df = pd.read_csv(input_filename)
-        detector = PIIDetector()
-        out = []
+def process_records(detector: PIIDetector, ids: Any, jsons: Any) -> Tuple[List[Optional[str]], List[bool]]:
+    """Parse, detect and redact a batch of raw JSON strings; returns (redacted_json, is_pii) lists."""
+    n = len(ids)
+    out_json: List[Optional[str]] = [None] * n
+    out_pii: List[bool] = [False] * n
+
+    for i in range(n):
+        raw_json = jsons[i]
+        try:
+            data = json.loads(raw_json)
+            is_pii, red_data = detector.process_record(data)
+            out_json[i] = json.dumps(red_data)
+            out_pii[i] = is_pii
+        except Exception as e:
+            # Keep original JSON, mark as non-PII to avoid false positives on parse errors
+            print(f"Error processing record {ids[i]}: {e}")
+            out_json[i] = raw_json if isinstance(raw_json, str) else None
+            out_pii[i] = False
+    return out_json, out_pii
 
-        print(f"Processing {len(df)} records...")
 
-        # Accept either 'data_json' or 'Data_json'
-        json_col = next((c for c in ['data_json', 'Data_json', 'Data_JSON', 'data_JSON'] if c in df.columns), None)
+# ---------- Parallel processing ----------
+# Records per unit of work handed to process_records / a worker process
+CHUNK_SIZE = 1000
+
+_worker_detector: Optional[PIIDetector] = None
+
+
+def _init_worker() -> None:
+    # One detector per worker process, reused across all of its chunks
+    global _worker_detector
+    _worker_detector = PIIDetector()
+
+
+def _process_chunk(chunk: Tuple[Any, Any]) -> Tuple[Any, List[Optional[str]], List[bool]]:
+    assert _worker_detector is not None, "worker not initialised"
+    ids, jsons = chunk
+    return (ids, *process_records(_worker_detector, ids, jsons))
+
+
+def iter_chunks(reader: Iterable[pd.DataFrame], json_col: str) -> Iterator[Tuple[Any, Any]]:
+    """Yield (ids, jsons) arrays of up to CHUNK_SIZE records across all chunks of a CSV reader."""
+    for df in reader:
+        # Plain arrays instead of df.iterrows(), which builds a Series per row
+        # Without a record_id column fall back to the row index, as before
+        ids = (df['record_id'] if 'record_id' in df.columns else df.index).to_numpy()
+        jsons = df[json_col].to_numpy()
+        for i in range(0, len(ids), CHUNK_SIZE):
+            yield ids[i:i + CHUNK_SIZE], jsons[i:i + CHUNK_SIZE]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Detect and redact PII in a JSON-in-CSV dataset.")
+    parser.add_argument('input_csv_file')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="worker processes to use (default: 1, 0 = one per CPU)")
+    args = parser.parse_args()
+
+    input_filename = args.input_csv_file
+
+    try:
+        # Check the header before touching the output file, so a bad input leaves nothing behind
+        header = pd.read_csv(input_filename, nrows=0).columns
+        json_col = next((c for c in JSON_COLUMNS if c in header), None)
         if not json_col:
             raise KeyError("CSV must contain 'data_json' or 'Data_json' column.")
 
-        for idx, row in df.iterrows():
-            try:
-                record_id = row['record_id']
-                raw_json = row[json_col]
-                data = json.loads(raw_json)
-
-                is_pii, red_data = detector.process_record(data)
-                out.append({
-                    'record_id': record_id,
-                    'redacted_data_json': json.dumps(red_data),
-                    'is_pii': is_pii
-                })
-            except Exception as e:
-                # Keep original JSON, mark as non-PII to avoid false positives on parse errors
-                record_id = row.get('record_id', idx) if hasattr(row, 'get') else idx
-                raw_json = row[json_col] if json_col in row else "{}"
-                print(f"Error processing record {record_id}: {e}")
-                out.append({
-                    'record_id': record_id,
-                    'redacted_data_json': raw_json,
-                    'is_pii': False
-                })
-
-        pd.DataFrame(out).to_csv('redacted_output_candidate_full_name.csv', index=False)
-
-        pii_count = sum(1 for r in out if r['is_pii'])
+        # Stream the input in chunks so memory stays O(READ_CHUNK_SIZE) however large the file.
+        # No usecols: with it the C parser silently drops surplus fields instead of
+        # rejecting malformed rows, which could let unredacted PII through.
+        reader = pd.read_csv(input_filename, engine='c', chunksize=READ_CHUNK_SIZE)
+
+        print(f"Processing records from {input_filename}...")
+
+        detector = PIIDetector()
+        n = pii_count = 0
+        pool_ctx = mp.Pool(args.jobs or None, initializer=_init_worker) if args.jobs != 1 else nullcontext()
+        # Write to a temp file next to the output and only move it into place once the
+        # whole input has been processed, so a failure partway leaves no truncated CSV
+        fd, tmp_path = tempfile.mkstemp(prefix='.redacted_', suffix='.csv.tmp',
+                                        dir=os.path.dirname(os.path.abspath(OUTPUT_FILENAME)))
+        try:
+            with pool_ctx as pool, open(fd, 'wb') as out_f:
+                # '\n' here and in write_output, so line endings don't depend on os.linesep
+                out_f.write((','.join(OUTPUT_COLUMNS) + '\n').encode())
+
+                chunks = iter_chunks(reader, json_col)
+                if pool is None:
+                    results: Iterable[Tuple[Any, List[Optional[str]], List[bool]]] = (
+                        (c_ids, *process_records(detector, c_ids, c_jsons)) for c_ids, c_jsons in chunks)
+                else:
+                    # One imap over the whole stream keeps every worker busy across read
+                    # chunks and returns results in input order. The pool's task pipe
+                    # blocks once workers fall behind, so reading stays bounded.
+                    results = pool.imap(_process_chunk, chunks, chunksize=1)
+
+                for c_ids, c_json, c_pii in results:
+                    write_output(out_f, c_ids, c_json, c_pii)
+                    n += len(c_ids)
+                    pii_count += sum(c_pii)
+
+            # mkstemp creates the file 0600; give it the usual umask-based mode
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, OUTPUT_FILENAME)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
         print("Processing complete!")
-        print(f"Total records processed: {len(out)}")
+        print(f"Total records processed: {n}")
         print(f"PII records: {pii_count}")
-        print(f"Non-PII records: {len(out) - pii_count}")
-        print("Output saved to: redacted_output_candidate_full_name.csv")
+        print(f"Non-PII records: {n - pii_count}")
+        print(f"Output saved to: {OUTPUT_FILENAME}")
 
     except FileNotFoundError:
         print(f"Error: File '{input_filename}' not found.")
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ISCP_Pii.py')
+OUTPUT = 'redacted_output_candidate_full_name.csv'
+
+
+class MainRegressionTest(unittest.TestCase):
+    """Run the script end to end on small CSVs in a scratch directory."""
+
+    def run_script(self, csv_text: str, *args: str) -> subprocess.CompletedProcess:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        path = os.path.join(self.tmp.name, 'input.csv')
+        with open(path, 'w', newline='', errors='surrogateescape') as f:
+            f.write(csv_text)
+        return subprocess.run([sys.executable, SCRIPT, path, *args], cwd=self.tmp.name,
+                              capture_output=True, text=True)
+
+    def read_output(self) -> str:
+        with open(os.path.join(self.tmp.name, OUTPUT), newline='') as f:
+            return f.read()
+
+    def test_masks_phone(self):
+        result = self.run_script('record_id,data_json\n1,"{""phone"": ""9876543210""}"\n')
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertEqual(self.read_output(),
+                         'record_id,redacted_data_json,is_pii\n1,"{""phone"": ""98XXXXXX10""}",True\n')
+
+    def test_jobs_output_matches_serial(self):
+        # Several worker chunks; results must come back complete and in input order
+        rows = ''.join(f'{i},"{{""phone"": ""98765{i:05d}""}}"\n' for i in range(1, 2501))
+        self.run_script('record_id,data_json\n' + rows)
+        serial = self.read_output()
+        result = self.run_script('record_id,data_json\n' + rows, '--jobs', '2')
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertEqual(self.read_output(), serial)
+        self.assertEqual(serial.count('\n'), 2501)
+
+    def test_malformed_row_is_rejected(self):
+        # Unquoted JSON splits into extra fields; this must fail, not pass the raw phone through
+        result = self.run_script('record_id,data_json\n'
+                                 '1,"{""a"": 1}"\n'
+                                 '2,{"phone": "9876543211", "x": 1}\n')
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('Expected 2 fields', result.stdout)
+        self.assertEqual(os.listdir(self.tmp.name), ['input.csv'])
+
+    def test_read_error_partway_leaves_no_output(self):
+        # An undecodable row after the first read chunk must not leave a truncated CSV behind
+        rows = ''.join(f'{i},"{{""a"": {i}}}"\n' for i in range(1, 25001))
+        result = self.run_script('record_id,data_json\n' + rows + '25001,"\udcff"\n')
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(os.listdir(self.tmp.name), ['input.csv'])
+
+
+if __name__ == '__main__':
+    unittest.main()